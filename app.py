@@ -65,6 +65,22 @@ def plot_line(x, y, title, color="#25D366", rotation=45):
     ax.grid(alpha=0.25)
     st.pyplot(fig)
 
+def plot_lines(timelines, x, title, rotation=45):
+    fig, ax = plt.subplots(figsize=(10, 3.5))
+    for label, timeline in timelines.items():
+        ax.plot(timeline[x], timeline['message'], linewidth=2, marker='o', label=label)
+    ax.set_title(title, color="#075E54", fontsize=14, fontweight='bold')
+    plt.xticks(rotation=rotation)
+    ax.grid(alpha=0.25)
+    ax.legend()
+    st.pyplot(fig)
+
+@st.cache_resource(max_entries=5, ttl=3600)
+def load_search_index(data, _df):
+    # Keyed on the raw chat text so the index is built once per uploaded chat;
+    # shared by every session, so keep only a few recent chats in memory
+    return helper.build_search_index(_df)
+
 # Sidebar
 with st.sidebar:
     st.title("📱 WhatsApp Analyzer")
@@ -83,10 +99,53 @@ if uploaded_file is not None:
     user_list.insert(0, "Overall")
 
     selected_user = st.sidebar.selectbox("Show analysis wrt", user_list)
+    search_query = st.sidebar.text_input("Search messages", placeholder='e.g. party or "see you"')
     
     st.sidebar.markdown("---")
     show_analysis = st.sidebar.button("🔍 Show Analysis", use_container_width=True, type="primary")
 
+    # Keyword Search renders on every rerun, so a new query only costs an index
+    # lookup instead of recomputing the whole dashboard
+    if search_query.strip():
+        st.header("🔎 Keyword Search")
+        st.markdown("**Find when and who talked about a topic**")
+        
+        if not helper.parse_query(search_query):
+            st.warning(f"⚠️ '{search_query}' has no searchable words or emojis.")
+        else:
+            search_index = load_search_index(data, df)
+            results, monthly, daily, user_counts = helper.keyword_search(selected_user, df, search_index, search_query)
+            
+            if not results.empty:
+                st.subheader(f"💬 Matching Messages ({results.shape[0]})")
+                st.markdown("Every message containing all the searched words and \"quoted phrases\".")
+                st.dataframe(results, use_container_width=True, hide_index=True)
+                
+                st.markdown("---")
+                
+                st.subheader("📅 Monthly Mentions")
+                st.markdown("One line per searched word or phrase.")
+                plot_lines(monthly, 'time', "Monthly Timeline - Mentions per Term")
+                
+                st.subheader("📆 Daily Mentions")
+                plot_lines(daily, 'only_date', "Daily Timeline - Mentions per Term", rotation=90)
+                
+                st.markdown("---")
+                
+                st.subheader("👥 Mentions by User")
+                fig, ax = plt.subplots(figsize=(8, 5))
+                ax.bar(user_counts.index, user_counts.values, color='#25D366', edgecolor='black', linewidth=1.2)
+                plt.xticks(rotation=45, ha='right')
+                ax.set_ylabel("Number of Messages", fontweight='bold')
+                ax.set_xlabel("Users", fontweight='bold')
+                ax.set_title(f"Who Mentioned '{search_query}'", fontweight='bold', color='#075E54')
+                ax.grid(alpha=0.3, axis='y')
+                st.pyplot(fig)
+            else:
+                st.info(f"😔 No messages found for '{search_query}'.")
+        
+        st.markdown("---")
+
     if show_analysis:
         tabs = st.tabs([
             "📊 Top Statistics",
@@ -327,7 +386,7 @@ if uploaded_file is not None:
                 st.info("💡 Sentiment analysis uses natural language processing to classify messages as Positive, Negative, or Neutral, helping you understand the overall mood of the conversation.")
             else:
                 st.warning("⚠️ No sentiment data available for analysis.")
-    else:
+    elif not search_query.strip():
         st.info("👆 Please click the 'Show Analysis' button in the sidebar to view the analysis.")
 
 else:
@@ -1,10 +1,12 @@
 from urlextract import URLExtract
 from wordcloud import WordCloud
 import pandas as pd
-from collections import Counter
+from collections import Counter, defaultdict
 import emoji
 from textblob import TextBlob
 import numpy as np
+import re
+import unicodedata
 
 extract = URLExtract()
 
@@ -181,6 +183,133 @@ def perform_sentiment_analysis(selected_user, df):
     
     return sentiment_counts, sentiment_percentages
 
+def _word_tokens(text):
+    tokens = []
+    word = ''
+    for char in text.lower():
+        # Combining marks (e.g. Devanagari vowel signs and virama) are part of the word
+        if char.isalnum() or char == '_' or unicodedata.category(char).startswith('M'):
+            word += char
+        elif word:
+            tokens.append(word)
+            word = ''
+    if word:
+        tokens.append(word)
+    return tokens
+
+def tokenize(message):
+    """Split a message into lowercase word and emoji tokens used by the search index"""
+    if pd.isna(message):
+        return []
+    message = str(message)
+    
+    # Pull out whole emoji sequences (flags, keycaps, ZWJ sequences) before splitting words
+    tokens = []
+    last = 0
+    for match in emoji.emoji_list(message):
+        tokens.extend(_word_tokens(message[last:match['match_start']]))
+        tokens.append(match['emoji'])
+        last = match['match_end']
+    tokens.extend(_word_tokens(message[last:]))
+    return tokens
+
+def build_search_index(df):
+    """Build an inverted index token -> {message id: [positions]} over the message column"""
+    # Filter out media messages and system notifications properly
+    df = df[~df['message'].str.contains('omitted', case=False, na=False)]
+    df = df[df['user'] != 'system_notification']
+    
+    index = defaultdict(dict)
+    for msg_id, message in zip(df.index, df['message']):
+        for pos, token in enumerate(tokenize(message)):
+            index[token].setdefault(msg_id, []).append(pos)
+    return dict(index)
+
+def parse_query(query):
+    """Split a query into phrases; "quoted text" is one phrase, other words are single terms"""
+    phrases = []
+    for quoted, word in re.findall(r'"([^"]*)"|(\S+)', query):
+        tokens = tokenize(quoted if quoted else word)
+        if tokens:
+            phrases.append(tokens)
+    return phrases
+
+def _phrase_ids(index, tokens):
+    postings = [index.get(token) for token in tokens]
+    if not all(postings):
+        return set()
+    
+    # Intersect starting from the rarest token to keep the candidate set small
+    ids = set(min(postings, key=len))
+    for posting in postings:
+        ids &= posting.keys()
+        if not ids:
+            return set()
+    
+    if len(tokens) == 1:
+        return ids
+    
+    # Keep only messages where the tokens appear at consecutive positions
+    matches = set()
+    for msg_id in ids:
+        starts = set(postings[0][msg_id])
+        for offset, posting in enumerate(postings[1:], start=1):
+            starts &= {pos - offset for pos in posting[msg_id]}
+            if not starts:
+                break
+        if starts:
+            matches.add(msg_id)
+    return matches
+
+def match_phrases(index, query):
+    """Map each term/phrase of the query to the set of message ids containing it"""
+    matches = {}
+    for tokens in parse_query(query):
+        label = tokens[0] if len(tokens) == 1 else '"' + ' '.join(tokens) + '"'
+        matches[label] = _phrase_ids(index, tokens)
+    return matches
+
+def _align_timelines(timelines, keys):
+    """Put per-term timelines on the union of their periods, filling missing ones with 0"""
+    if not timelines:
+        return timelines
+    
+    axis = pd.concat([t[keys] for t in timelines.values()]).drop_duplicates()
+    axis = axis.sort_values(keys).reset_index(drop=True)
+    
+    aligned = {}
+    for term, timeline in timelines.items():
+        merged = axis.merge(timeline[keys + ['message']], on=keys, how='left')
+        merged['message'] = merged['message'].fillna(0).astype(int)
+        aligned[term] = merged[timeline.columns]
+    return aligned
+
+def keyword_search(selected_user, df, index, query):
+    """Matching messages, per-term monthly/daily timelines and per-user counts for a query"""
+    phrase_ids = match_phrases(index, query)
+    
+    # The results table and per-user counts cover messages matching every term
+    ids = set.intersection(*phrase_ids.values()) if phrase_ids else set()
+    
+    matches = df.loc[sorted(ids)]
+    if selected_user != 'Overall':
+        matches = matches[matches['user'] == selected_user]
+    
+    results = matches[['message_date', 'user', 'message']].reset_index(drop=True)
+    user_counts = matches['user'].value_counts()
+    
+    monthly = {}
+    daily = {}
+    for term, term_ids in phrase_ids.items():
+        term_df = df.loc[sorted(term_ids)]
+        monthly[term] = monthly_timeline(selected_user, term_df)
+        daily[term] = daily_timeline(selected_user, term_df)
+    
+    monthly = _align_timelines(monthly, ['year', 'month_num', 'month', 'time'])
+    daily = _align_timelines(daily, ['only_date'])
+    
+    return results, monthly, daily, user_counts
+
 def debug_media_messages(df):
     """Debug function to see what media messages look like"""
     print("=== DEBUG: All unique messages ===")